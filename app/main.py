@@ -4,14 +4,25 @@ Main Streamlit application entry point
 """
 
 import streamlit as st
-import json
+import mmap
+import os
+import pickle
+import numpy as np
+import orjson
 import yaml
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Page config
 st.set_page_config(
     page_title="PCI DSS Compliance Dashboard",
@@ -22,90 +33,312 @@ st.set_page_config(
 
 # Data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
+CACHE_DIR = DATA_DIR / ".cache"
+FINDINGS_FILE = DATA_DIR / "simulated_findings.json"
+TREND_FILE = DATA_DIR / "simulated_trend.json"
+
+# Upper bound on points sent to the browser per trend line
+TREND_MAX_POINTS = 2000
+
+# Above this many plotted points, unified hover labels get slow to compute
+# (kept below TREND_MAX_POINTS so downsampled charts can still reach it)
+UNIFIED_HOVER_MAX_POINTS = 1000
+
+
+def parse_yaml(buf: memoryview):
+    """Parse a YAML document."""
+    return yaml.load(bytes(buf), Loader=YamlLoader)
+
+
+def parse_json(buf: memoryview):
+    """Parse a JSON document."""
+    return orjson.loads(buf)
+
+
+def load_data_file(path: Path, parse):
+    """Parse a data file, reusing a pickled copy while the source is unchanged."""
+    cache_file = CACHE_DIR / f"{path.name}.{path.stat().st_mtime_ns}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible cache file: re-parse the source
+        pass
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            data = parse(buf)
 
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        for stale in CACHE_DIR.glob(f"{path.name}.*.pkl"):
+            stale.unlink(missing_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        tmp_file.unlink(missing_ok=True)
+    return data
 
-@st.cache_data
+
+# The raw loaders share one object across all sessions without copying it,
+# so callers must treat the returned data as read-only.
+@st.cache_resource
 def load_requirements():
     """Load PCI DSS requirements from YAML."""
-    with open(DATA_DIR / "pci_requirements.yaml") as f:
-        return yaml.safe_load(f)["requirements"]
+    return load_data_file(DATA_DIR / "pci_requirements.yaml", parse_yaml)["requirements"]
 
 
-@st.cache_data
+@st.cache_resource
 def load_control_status():
     """Load current control status."""
-    with open(DATA_DIR / "simulated_control_status.json") as f:
-        return json.load(f)
+    return load_data_file(DATA_DIR / "simulated_control_status.json", parse_json)
 
 
-@st.cache_data
-def load_findings():
+# The findings caches take the findings file's mtime_ns only as a cache key, so
+# an edited file gets a fresh entry; max_entries=1 drops the superseded one.
+@st.cache_resource(max_entries=1)
+def load_findings(mtime_ns: int):
     """Load all findings."""
-    with open(DATA_DIR / "simulated_findings.json") as f:
-        return json.load(f)["findings"]
+    return load_data_file(FINDINGS_FILE, parse_json)["findings"]
+
+
+@st.cache_data(max_entries=1)
+def load_findings_df(mtime_ns: int):
+    """Load all findings as an Arrow-backed DataFrame for vectorized filtering and counting."""
+    table = pa.Table.from_pylist(load_findings(mtime_ns))
+    columns = {
+        "severity": pc.utf8_lower(table["severity"]).dictionary_encode(),
+        "status": pc.utf8_lower(table["status"]).dictionary_encode(),
+        "requirement_id": table["requirement_id"].dictionary_encode(),
+        "detected_at": table["detected_at"].cast(pa.timestamp("us", tz="UTC")),
+    }
+    for name, column in columns.items():
+        table = table.set_column(table.schema.get_field_index(name), name, column)
+    
+    # Dictionary columns become pandas categoricals and timestamps NumPy datetimes
+    # (so to_csv honours date_format); everything else stays Arrow-backed
+    return table.to_pandas(
+        types_mapper=lambda t: None if pa.types.is_dictionary(t) or pa.types.is_timestamp(t) else pd.ArrowDtype(t)
+    )
+
+
+@st.cache_data(max_entries=1)
+def index_findings(mtime_ns: int):
+    """Group finding records by requirement and count open/critical findings."""
+    records = load_findings(mtime_ns)
+    df = load_findings_df(mtime_ns)
+    by_req = {
+        req_id: [records[i] for i in idx]
+        for req_id, idx in df.groupby("requirement_id", observed=True).indices.items()
+    }
+    is_open = df["status"] == "open"
+    open_count = int(is_open.sum())
+    open_critical_count = int((is_open & (df["severity"] == "critical")).sum())
+    return by_req, open_count, open_critical_count
 
 
-@st.cache_data
-def load_trend_data():
-    """Load compliance trend data."""
-    with open(DATA_DIR / "simulated_trend.json") as f:
-        return json.load(f)
+# The trend caches take the trend file's mtime_ns only as a cache key, so an
+# edited file gets a fresh entry; max_entries=1 drops the superseded one.
+@st.cache_resource(max_entries=1)
+def load_trend_data(mtime_ns: int):
+    """Load compliance trend data (cached per trend-file mtime)."""
+    return load_data_file(TREND_FILE, parse_json)
 
 
-def get_requirement_name(req_id: str, requirements: list) -> str:
+@st.cache_data(max_entries=1)
+def get_trend_df(mtime_ns: int):
+    """Load the compliance trend series as a DataFrame with parsed dates."""
+    df = pd.DataFrame(load_trend_data(mtime_ns)["trend_data"])
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", cache=True)
+    return df
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return indices of the points kept by Largest-Triangle-Three-Buckets downsampling."""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+@st.cache_data(max_entries=1)
+def downsample_trend(_df_trend: pd.DataFrame, mtime_ns: int, n_out: int = TREND_MAX_POINTS) -> pd.DataFrame:
+    """Reduce the trend series to n_out representative points (cached per trend-file mtime)."""
+    if len(_df_trend) <= n_out:
+        return _df_trend
+    x = _df_trend["date"].to_numpy(dtype="datetime64[ns]").astype(np.float64)
+    y = _df_trend["compliance_score"].to_numpy(dtype=np.float64)
+    return _df_trend.iloc[lttb_indices(x, y, n_out)].reset_index(drop=True)
+
+
+def hover_layout(n_points: int) -> dict:
+    """Return hover layout settings suited to a chart plotting n_points points."""
+    if n_points > UNIFIED_HOVER_MAX_POINTS:
+        return dict(hovermode="x", spikedistance=-1, hoverdistance=20)
+    return dict(hovermode="x unified")
+
+
+# Figures are held in st.cache_resource because unpickling a Figure from
+# st.cache_data re-runs Plotly's validation. The shared figures are read-only:
+# st.plotly_chart only serializes them, and nothing else may modify them.
+@st.cache_resource(max_entries=1)
+def build_summary_trend_fig(mtime_ns: int) -> go.Figure:
+    """Build the Executive Summary trend chart (cached per trend-file mtime)."""
+    df_trend = get_trend_df(mtime_ns)
+    df_plot = downsample_trend(df_trend, mtime_ns)
+    
+    fig = px.line(
+        df_plot, 
+        x="date", 
+        y="compliance_score",
+        markers=True,
+        render_mode="webgl",
+        color_discrete_sequence=["#0d6efd"],
+        labels={"compliance_score": "Compliance Score (%)", "date": "Date"}
+    )
+    fig.update_layout(
+        yaxis_range=[0, 100],
+        **hover_layout(len(df_plot))
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=1)
+def build_trend_fig(mtime_ns: int) -> go.Figure:
+    """Build the annotated Trend Analysis chart (cached per trend-file mtime)."""
+    df_trend = get_trend_df(mtime_ns)
+    df_plot = downsample_trend(df_trend, mtime_ns)
+    
+    # Add event annotations
+    scores_by_date = dict(zip(df_trend["date"], df_trend["compliance_score"]))
+    annotations = []
+    for event in load_trend_data(mtime_ns)["events"]:
+        event_date = pd.to_datetime(event["date"])
+        score = scores_by_date.get(event_date)
+        if score is not None:
+            annotations.append(dict(
+                x=event_date,
+                y=score,
+                text=event["event"],
+                showarrow=True,
+                arrowhead=2,
+                arrowsize=1,
+                arrowwidth=2,
+                ax=0,
+                ay=-40,
+                font=dict(size=10)
+            ))
+    
+    # Hand-written spec: skip Plotly's property validation
+    return go.Figure(
+        data=[go.Scattergl(
+            x=df_plot["date"],
+            y=df_plot["compliance_score"],
+            mode="lines+markers",
+            name="Compliance Score",
+            line=dict(color="#0d6efd", width=3),
+            marker=dict(size=8),
+            _validate=False
+        )],
+        layout=dict(
+            yaxis=dict(range=[0, 100], title=dict(text="Compliance Score (%)")),
+            xaxis=dict(title=dict(text="Date")),
+            height=400,
+            annotations=annotations,
+            **hover_layout(len(df_plot))
+        ),
+        _validate=False
+    )
+
+
+def get_requirement_name(req_id: str) -> str:
     """Get requirement name by ID."""
-    for req in requirements:
-        if req["id"] == req_id:
-            return req["name"]
-    return req_id
+    return REQ_NAME_BY_ID.get(req_id, req_id)
+
+
+SEVERITY_LEVELS = ("critical", "high", "medium", "low")
+FINDING_STATUSES = ("open", "remediated")
+
+# Matches the ISO timestamps in the source data
+EXPORT_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+DEFAULT_COLOR = "#6c757d"
+
+SEVERITY_COLOR_MAP = {
+    "critical": "#dc3545",
+    "high": "#fd7e14",
+    "medium": "#ffc107",
+    "low": "#28a745"
+}
+
+STATUS_COLOR_MAP = {
+    "pass": "#28a745",
+    "fail": "#dc3545",
+    "unknown": "#6c757d"
+}
 
 
 def severity_color(severity: str) -> str:
     """Return color for severity level."""
-    colors = {
-        "critical": "#dc3545",
-        "high": "#fd7e14",
-        "medium": "#ffc107",
-        "low": "#28a745"
-    }
-    return colors.get(severity.lower(), "#6c757d")
+    return SEVERITY_COLOR_MAP.get(severity.lower(), DEFAULT_COLOR)
 
 
 def status_color(status: str) -> str:
     """Return color for status."""
-    colors = {
-        "pass": "#28a745",
-        "fail": "#dc3545",
-        "unknown": "#6c757d"
-    }
-    return colors.get(status.lower(), "#6c757d")
+    return STATUS_COLOR_MAP.get(status.lower(), DEFAULT_COLOR)
+
+
+# Shared styles for the requirement status cards
+CARD_CSS = """
+<style>
+.req-card { padding: 1rem; border-radius: 0.5rem; border: 1px solid #ddd; margin-bottom: 1rem; }
+.req-card.pass { background: #d4edda; }
+.req-card.fail { background: #f8d7da; }
+.req-card h4 { margin: 0; }
+.req-card .req-name { margin: 0.5rem 0 0 0; font-weight: bold; }
+.req-card .req-details { margin: 0.25rem 0 0 0; font-size: 0.9rem; color: #666; }
+.req-card .req-findings { margin: 0.25rem 0 0 0; font-size: 0.8rem; }
+</style>
+"""
 
 
 # Load data
 requirements = load_requirements()
 control_status = load_control_status()
-findings = load_findings()
-trend_data = load_trend_data()
+findings_mtime_ns = FINDINGS_FILE.stat().st_mtime_ns
+findings_df = load_findings_df(findings_mtime_ns)
+FINDINGS_BY_REQ, OPEN_COUNT, OPEN_CRITICAL_COUNT = index_findings(findings_mtime_ns)
+trend_mtime_ns = TREND_FILE.stat().st_mtime_ns
+trend_data = load_trend_data(trend_mtime_ns)
 
-# Sidebar
-st.sidebar.title("🔒 PCI DSS 4.0")
-st.sidebar.markdown("**Continuous Monitoring Dashboard**")
-st.sidebar.divider()
-
-page = st.sidebar.radio(
-    "Navigation",
-    ["Executive Summary", "Requirement Details", "Findings", "Trend Analysis"],
-    index=0
-)
+# Lookup tables
+REQ_IDS = tuple(r["id"] for r in requirements)
+REQ_BY_ID = {r["id"]: r for r in requirements}
+REQ_NAME_BY_ID = {r["id"]: r["name"] for r in requirements}
+CONTROL_BY_REQ = {c["requirement_id"]: c for c in control_status["controls"]}
 
-st.sidebar.divider()
-st.sidebar.markdown("**Last Updated**")
-st.sidebar.markdown(f"📅 {control_status['snapshot_date']}")
-st.sidebar.markdown(f"✅ {control_status['summary']['passing']} Passing")
-st.sidebar.markdown(f"❌ {control_status['summary']['failing']} Failing")
 
-# Main content
-if page == "Executive Summary":
+# Pages
+def render_executive_summary():
+    """Render the Executive Summary page."""
     st.title("📊 Executive Summary")
     st.markdown("Real-time PCI DSS 4.0 compliance posture for your cardholder data environment.")
     
@@ -136,13 +369,11 @@ if page == "Executive Summary":
             delta_color="inverse"
         )
     
-    open_findings = len([f for f in findings if f["status"] == "open"])
-    critical_findings = len([f for f in findings if f["status"] == "open" and f["severity"] == "critical"])
     with col4:
         st.metric(
             label="Open Findings",
-            value=open_findings,
-            delta=f"{critical_findings} critical" if critical_findings > 0 else None,
+            value=OPEN_COUNT,
+            delta=f"{OPEN_CRITICAL_COUNT} critical" if OPEN_CRITICAL_COUNT > 0 else None,
             delta_color="off"
         )
     
@@ -151,45 +382,38 @@ if page == "Executive Summary":
     # Requirement status cards
     st.subheader("📋 Requirement Status")
     
+    st.markdown(CARD_CSS, unsafe_allow_html=True)
+    
     cols = st.columns(3)
+    col_html = ["", "", ""]
     for i, control in enumerate(control_status["controls"]):
-        req_name = get_requirement_name(control["requirement_id"], requirements)
-        with cols[i % 3]:
-            status = control["status"]
-            icon = "✅" if status == "pass" else "❌"
-            color = "green" if status == "pass" else "red"
-            
-            st.markdown(f"""
-            <div style="padding: 1rem; border-radius: 0.5rem; border: 1px solid #ddd; margin-bottom: 1rem; background: {'#d4edda' if status == 'pass' else '#f8d7da'};">
-                <h4 style="margin: 0;">{icon} {control['requirement_id'].replace('_', ' ').upper()}</h4>
-                <p style="margin: 0.5rem 0 0 0; font-weight: bold;">{req_name}</p>
-                <p style="margin: 0.25rem 0 0 0; font-size: 0.9rem; color: #666;">{control['details']}</p>
-                <p style="margin: 0.25rem 0 0 0; font-size: 0.8rem;">Findings: {control['finding_count']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        req_name = get_requirement_name(control["requirement_id"])
+        status = control["status"]
+        icon = "✅" if status == "pass" else "❌"
+        
+        col_html[i % 3] += (
+            f'<div class="req-card {"pass" if status == "pass" else "fail"}">'
+            f'<h4>{icon} {control["requirement_id"].replace("_", " ").upper()}</h4>'
+            f'<p class="req-name">{req_name}</p>'
+            f'<p class="req-details">{control["details"]}</p>'
+            f'<p class="req-findings">Findings: {control["finding_count"]}</p>'
+            f'</div>'
+        )
+    
+    for col, html in zip(cols, col_html):
+        col.markdown(html, unsafe_allow_html=True)
     
     st.divider()
     
     # Quick trend chart
     st.subheader("📈 Compliance Trend (Last 16 Days)")
-    df_trend = pd.DataFrame(trend_data["trend_data"])
-    df_trend["date"] = pd.to_datetime(df_trend["date"])
-    
-    fig = px.line(
-        df_trend, 
-        x="date", 
-        y="compliance_score",
-        markers=True,
-        labels={"compliance_score": "Compliance Score (%)", "date": "Date"}
-    )
-    fig.update_layout(
-        yaxis_range=[0, 100],
-        hovermode="x unified"
-    )
-    fig.update_traces(line_color="#0d6efd", marker_color="#0d6efd")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = build_summary_trend_fig(trend_mtime_ns)
+    st.plotly_chart(fig, width="stretch")
+
 
-elif page == "Requirement Details":
+@st.fragment
+def render_requirement_details():
+    """Render the Requirement Details page."""
     st.title("📋 Requirement Details")
     st.markdown("Drill into each PCI DSS requirement to see findings and evidence.")
     
@@ -199,8 +423,8 @@ elif page == "Requirement Details":
     selected_req = req_options[selected_label]
     
     # Get control status for selected requirement
-    control = next((c for c in control_status["controls"] if c["requirement_id"] == selected_req), None)
-    req_info = next((r for r in requirements if r["id"] == selected_req), None)
+    control = CONTROL_BY_REQ.get(selected_req)
+    req_info = REQ_BY_ID.get(selected_req)
     
     if control and req_info:
         st.divider()
@@ -224,7 +448,7 @@ elif page == "Requirement Details":
         st.divider()
         
         # Findings for this requirement
-        req_findings = [f for f in findings if f["requirement_id"] == selected_req]
+        req_findings = FINDINGS_BY_REQ.get(selected_req, [])
         
         if req_findings:
             st.subheader(f"🔍 Findings ({len(req_findings)})")
@@ -234,16 +458,21 @@ elif page == "Requirement Details":
                 status_icon = "🔴" if finding["status"] == "open" else "🟢"
                 
                 with st.expander(f"{status_icon} [{severity.upper()}] {finding['title']}"):
-                    st.markdown(f"**ID:** {finding['id']}")
-                    st.markdown(f"**Status:** {finding['status'].upper()}")
-                    st.markdown(f"**Resource:** `{finding['resource_id']}`")
-                    st.markdown(f"**Description:** {finding['description']}")
-                    st.markdown(f"**Remediation:** {finding['remediation']}")
-                    st.markdown(f"**Detected:** {finding['detected_at']}")
+                    st.markdown(
+                        f"**ID:** {finding['id']}\n\n"
+                        f"**Status:** {finding['status'].upper()}\n\n"
+                        f"**Resource:** `{finding['resource_id']}`\n\n"
+                        f"**Description:** {finding['description']}\n\n"
+                        f"**Remediation:** {finding['remediation']}\n\n"
+                        f"**Detected:** {finding['detected_at']}"
+                    )
         else:
             st.success("No findings for this requirement. ✅")
 
-elif page == "Findings":
+
+@st.fragment
+def render_findings():
+    """Render the Findings page."""
     st.title("🔍 All Findings")
     st.markdown("View and filter all compliance findings across requirements.")
     
@@ -253,141 +482,116 @@ elif page == "Findings":
     with col1:
         severity_filter = st.multiselect(
             "Severity",
-            ["critical", "high", "medium", "low"],
-            default=["critical", "high", "medium", "low"]
+            SEVERITY_LEVELS,
+            default=SEVERITY_LEVELS
         )
     
     with col2:
         status_filter = st.multiselect(
             "Status",
-            ["open", "remediated"],
+            FINDING_STATUSES,
             default=["open"]
         )
     
     with col3:
         req_filter = st.multiselect(
             "Requirement",
-            [r["id"] for r in requirements],
-            default=[r["id"] for r in requirements]
+            REQ_IDS,
+            default=REQ_IDS
         )
     
-    # Filter findings
-    filtered = [
-        f for f in findings
-        if f["severity"] in severity_filter
-        and f["status"] in status_filter
-        and f["requirement_id"] in req_filter
-    ]
+    # Filter findings (reused from session state while the filters and data are unchanged)
+    filter_key = (
+        findings_mtime_ns,
+        tuple(severity_filter),
+        tuple(status_filter),
+        tuple(req_filter),
+    )
+    if st.session_state.get("findings_filter_key") != filter_key:
+        mask = (
+            findings_df["severity"].isin(severity_filter)
+            & findings_df["status"].isin(status_filter)
+            & findings_df["requirement_id"].isin(req_filter)
+        )
+        df = findings_df.loc[mask, ["id", "severity", "status", "requirement_id", "title", "resource_id", "detected_at"]]
+        df.columns = ["ID", "Severity", "Status", "Requirement", "Title", "Resource", "Detected"]
+        st.session_state["findings_filter_key"] = filter_key
+        st.session_state["findings_filtered"] = df
+    df = st.session_state["findings_filtered"]
     
     st.divider()
-    st.markdown(f"**Showing {len(filtered)} of {len(findings)} findings**")
+    st.markdown(f"**Showing {len(df)} of {len(findings_df)} findings**")
     
     # Display as table
-    if filtered:
-        df = pd.DataFrame(filtered)
-        df = df[["id", "severity", "status", "requirement_id", "title", "resource_id", "detected_at"]]
-        df.columns = ["ID", "Severity", "Status", "Requirement", "Title", "Resource", "Detected"]
-        
+    if not df.empty:
         st.dataframe(
             df,
-            use_container_width=True,
+            width="stretch",
             hide_index=True,
             column_config={
                 "Severity": st.column_config.TextColumn(width="small"),
                 "Status": st.column_config.TextColumn(width="small"),
                 "Requirement": st.column_config.TextColumn(width="small"),
+                "Detected": st.column_config.DatetimeColumn(format="YYYY-MM-DD[T]HH:mm:ss[Z]"),
             }
         )
         
-        # Export button
-        csv = df.to_csv(index=False)
+        # Export button (CSV is only generated when the download is clicked)
         st.download_button(
             label="📥 Export to CSV",
-            data=csv,
+            data=lambda: df.to_csv(index=False, date_format=EXPORT_DATE_FORMAT),
             file_name=f"pci_findings_{datetime.now().strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
     else:
         st.info("No findings match the selected filters.")
 
-elif page == "Trend Analysis":
+
+def render_trend_analysis():
+    """Render the Trend Analysis page."""
     st.title("📈 Trend Analysis")
     st.markdown("Track compliance posture changes over time.")
     
-    df_trend = pd.DataFrame(trend_data["trend_data"])
-    df_trend["date"] = pd.to_datetime(df_trend["date"])
+    df_trend = get_trend_df(trend_mtime_ns)
     
     # Main trend chart
     st.subheader("Compliance Score Over Time")
+    fig = build_trend_fig(trend_mtime_ns)
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=df_trend["date"],
-        y=df_trend["compliance_score"],
-        mode="lines+markers",
-        name="Compliance Score",
-        line=dict(color="#0d6efd", width=3),
-        marker=dict(size=8)
-    ))
-    
-    # Add event annotations
-    for event in trend_data["events"]:
-        event_date = pd.to_datetime(event["date"])
-        score_at_date = df_trend[df_trend["date"] == event_date]["compliance_score"].values
-        if len(score_at_date) > 0:
-            fig.add_annotation(
-                x=event_date,
-                y=score_at_date[0],
-                text=event["event"],
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=2,
-                ax=0,
-                ay=-40,
-                font=dict(size=10)
-            )
-    
-    fig.update_layout(
-        yaxis_range=[0, 100],
-        yaxis_title="Compliance Score (%)",
-        xaxis_title="Date",
-        hovermode="x unified",
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, width="stretch")
     
     st.divider()
     
     # Pass/Fail breakdown
     st.subheader("Pass/Fail Breakdown Over Time")
     
-    fig2 = go.Figure()
-    
-    fig2.add_trace(go.Bar(
-        x=df_trend["date"],
-        y=df_trend["passing"],
-        name="Passing",
-        marker_color="#28a745"
-    ))
-    
-    fig2.add_trace(go.Bar(
-        x=df_trend["date"],
-        y=df_trend["failing"],
-        name="Failing",
-        marker_color="#dc3545"
-    ))
-    
-    fig2.update_layout(
-        barmode="stack",
-        yaxis_title="Requirements",
-        xaxis_title="Date",
-        height=300
+    fig2 = go.Figure(
+        data=[
+            go.Bar(
+                x=df_trend["date"],
+                y=df_trend["passing"],
+                name="Passing",
+                marker=dict(color="#28a745"),
+                _validate=False
+            ),
+            go.Bar(
+                x=df_trend["date"],
+                y=df_trend["failing"],
+                name="Failing",
+                marker=dict(color="#dc3545"),
+                _validate=False
+            )
+        ],
+        layout=dict(
+            barmode="stack",
+            yaxis=dict(title=dict(text="Requirements")),
+            xaxis=dict(title=dict(text="Date")),
+            height=300
+        ),
+        _validate=False
     )
     
-    st.plotly_chart(fig2, use_container_width=True)
+    st.plotly_chart(fig2, width="stretch")
     
     st.divider()
     
@@ -396,6 +600,35 @@ elif page == "Trend Analysis":
     for event in trend_data["events"]:
         st.markdown(f"- **{event['date']}**: {event['event']}")
 
+
+PAGES = {
+    "Executive Summary": render_executive_summary,
+    "Requirement Details": render_requirement_details,
+    "Findings": render_findings,
+    "Trend Analysis": render_trend_analysis,
+}
+
+
+# Sidebar
+st.sidebar.title("🔒 PCI DSS 4.0")
+st.sidebar.markdown("**Continuous Monitoring Dashboard**")
+st.sidebar.divider()
+
+page = st.sidebar.radio(
+    "Navigation",
+    list(PAGES),
+    index=0
+)
+
+st.sidebar.divider()
+st.sidebar.markdown("**Last Updated**")
+st.sidebar.markdown(f"📅 {control_status['snapshot_date']}")
+st.sidebar.markdown(f"✅ {control_status['summary']['passing']} Passing")
+st.sidebar.markdown(f"❌ {control_status['summary']['failing']} Failing")
+
+# Main content
+PAGES[page]()
+
 # Footer
 st.sidebar.divider()
 st.sidebar.markdown("---")